@@ -0,0 +1,31 @@
+import importlib
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import pytest
+
+# The package re-exports the main() function under the name "main", shadowing
+# the submodule on every attribute-based import path; importlib is the one
+# way to reliably get the module object itself.
+main_module = importlib.import_module("web_extraction_agent.main")
+
+
+@pytest.fixture
+def patched_handler(monkeypatch):
+    """Patch handler's collaborators in one place.
+
+    monkeypatch performs a plain setattr/delattr, skipping the autospec
+    machinery each unittest.mock.patch context manager pays, and replaces
+    the per-test stacks of with-patch blocks. The init task starts unset so
+    every test exercises handler from a clean slate; the returned namespace
+    exposes the run_agent and initialize_agent mocks for configuration and
+    assertions.
+    """
+    mock_run = AsyncMock()
+    mock_init = AsyncMock()
+    # Patch via the module object: a dotted-string target would getattr-
+    # resolve to the re-exported main() function instead of the module.
+    monkeypatch.setattr(main_module, "run_agent", mock_run)
+    monkeypatch.setattr(main_module, "initialize_agent", mock_init)
+    monkeypatch.setattr(main_module._State, "init_task", None)
+    return SimpleNamespace(run=mock_run, init=mock_init)
@@ -1,4 +1,4 @@
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import MagicMock
 
 import pytest
 
@@ -6,21 +6,17 @@ from web_extraction_agent.main import APIKeyError, handler
 
 
 @pytest.mark.asyncio
-async def test_handler_returns_response():
+async def test_handler_returns_response(patched_handler):
     """Test that handler accepts messages and returns a response."""
     messages = [{"role": "user", "content": "Hello, how are you?"}]
 
-    # Mock the run_agent function to return a mock response
+    # Configure run_agent to return a mock response
     mock_response = MagicMock()
     mock_response.run_id = "test-run-id"
     mock_response.status = "COMPLETED"
+    patched_handler.run.return_value = mock_response
 
-    # Mock _initialized to skip initialization and run_agent to return our mock
-    with (
-        patch("web_extraction_agent.main._initialized", True),
-        patch("web_extraction_agent.main.run_agent", new_callable=AsyncMock, return_value=mock_response),
-    ):
-        result = await handler(messages)
+    result = await handler(messages)
 
     # Verify we get a result back
     assert result is not None
@@ -29,7 +25,7 @@ async def test_handler_returns_response():
 
 
 @pytest.mark.asyncio
-async def test_handler_with_multiple_messages():
+async def test_handler_with_multiple_messages(patched_handler):
     """Test that handler processes multiple messages correctly."""
     messages = [
         {"role": "system", "content": "You are a helpful assistant."},
@@ -38,83 +34,55 @@ async def test_handler_with_multiple_messages():
 
     mock_response = MagicMock()
     mock_response.run_id = "test-run-id-2"
+    patched_handler.run.return_value = mock_response
 
-    with (
-        patch("web_extraction_agent.main._initialized", True),
-        patch("web_extraction_agent.main.run_agent", new_callable=AsyncMock, return_value=mock_response) as mock_run,
-    ):
-        result = await handler(messages)
+    result = await handler(messages)
 
     # Verify run_agent was called
-    mock_run.assert_called_once_with(messages)
+    patched_handler.run.assert_called_once_with(messages)
     assert result is not None
     assert result.run_id == "test-run-id-2"
 
 
 @pytest.mark.asyncio
-async def test_handler_initialization():
+async def test_handler_initialization(patched_handler):
     """Test that handler initializes on first call."""
     messages = [{"role": "user", "content": "Test"}]
 
     mock_response = MagicMock()
     mock_response.run_id = "test-init-run-id"
     mock_response.status = "COMPLETED"
+    patched_handler.run.return_value = mock_response
 
-    # Start with _initialized as False to test initialization path
-    with (
-        patch("web_extraction_agent.main._initialized", False),
-        patch("web_extraction_agent.main.initialize_agent", new_callable=AsyncMock) as mock_init,
-        patch("web_extraction_agent.main.run_agent", new_callable=AsyncMock, return_value=mock_response) as mock_run,
-        patch("web_extraction_agent.main._init_lock", new_callable=MagicMock()) as mock_lock,
-    ):
-        # Configure the lock to work as an async context manager
-        mock_lock_instance = MagicMock()
-        mock_lock_instance.__aenter__ = AsyncMock(return_value=None)
-        mock_lock_instance.__aexit__ = AsyncMock(return_value=None)
-        mock_lock.return_value = mock_lock_instance
-
-        result = await handler(messages)
-
-        # Verify initialization was called
-        mock_init.assert_called_once()
-        # Verify run_agent was called
-        mock_run.assert_called_once_with(messages)
-        # Verify we got a result
-        assert result is not None
-        assert result.run_id == "test-init-run-id"
-        assert result.status == "COMPLETED"
+    result = await handler(messages)
+
+    # Verify initialization was called
+    patched_handler.init.assert_called_once()
+    # Verify run_agent was called
+    patched_handler.run.assert_called_once_with(messages)
+    # Verify we got a result
+    assert result is not None
+    assert result.run_id == "test-init-run-id"
+    assert result.status == "COMPLETED"
 
 
 @pytest.mark.asyncio
-async def test_handler_race_condition_prevention():
-    """Test that handler prevents race conditions with initialization lock."""
+async def test_handler_race_condition_prevention(patched_handler):
+    """Test that concurrent handler calls share a single initialization task."""
     messages = [{"role": "user", "content": "Test"}]
 
-    mock_response = MagicMock()
+    patched_handler.run.return_value = MagicMock()
 
-    # Test with multiple concurrent calls
-    with (
-        patch("web_extraction_agent.main._initialized", False),
-        patch("web_extraction_agent.main.initialize_agent", new_callable=AsyncMock) as mock_init,
-        patch("web_extraction_agent.main.run_agent", new_callable=AsyncMock, return_value=mock_response),
-        patch("web_extraction_agent.main._init_lock", new_callable=MagicMock()) as mock_lock,
-    ):
-        # Configure the lock to work as an async context manager
-        mock_lock_instance = MagicMock()
-        mock_lock_instance.__aenter__ = AsyncMock(return_value=None)
-        mock_lock_instance.__aexit__ = AsyncMock(return_value=None)
-        mock_lock.return_value = mock_lock_instance
-
-        # Call handler twice to ensure lock is used
-        await handler(messages)
-        await handler(messages)
+    # Call handler twice to ensure the init task is reused
+    await handler(messages)
+    await handler(messages)
 
-        # Verify initialize_agent was called only once (due to lock)
-        mock_init.assert_called_once()
+    # Verify initialize_agent was called only once (shared init task)
+    patched_handler.init.assert_called_once()
 
 
 @pytest.mark.asyncio
-async def test_handler_with_web_extraction_query():
+async def test_handler_with_web_extraction_query(patched_handler):
     """Test that handler can process a web extraction query."""
     messages = [
         {
@@ -126,12 +94,9 @@ async def test_handler_with_web_extraction_query():
     mock_response = MagicMock()
     mock_response.run_id = "web-extract-run-id"
     mock_response.content = "Web extraction completed successfully."
+    patched_handler.run.return_value = mock_response
 
-    with (
-        patch("web_extraction_agent.main._initialized", True),
-        patch("web_extraction_agent.main.run_agent", new_callable=AsyncMock, return_value=mock_response),
-    ):
-        result = await handler(messages)
+    result = await handler(messages)
 
     assert result is not None
     assert result.run_id == "web-extract-run-id"
@@ -139,60 +104,40 @@ async def test_handler_with_web_extraction_query():
 
 
 @pytest.mark.asyncio
-async def test_handler_requires_api_key():
+async def test_handler_requires_api_key(patched_handler):
     """Test that handler raises error when no API key is provided."""
     messages = [{"role": "user", "content": "Test"}]
 
-    # Configure the lock to work as an async context manager
-    mock_lock_instance = MagicMock()
-    mock_lock_instance.__aenter__ = AsyncMock(return_value=None)
-    mock_lock_instance.__aexit__ = AsyncMock(return_value=None)
-
-    with (
-        patch("web_extraction_agent.main._initialized", False),
-        patch("web_extraction_agent.main.initialize_agent", side_effect=APIKeyError("No API key")),
-        patch("web_extraction_agent.main._init_lock", return_value=mock_lock_instance),
-        patch("web_extraction_agent.main.run_agent", new_callable=AsyncMock),
-        pytest.raises(APIKeyError, match="No API key"),
-    ):
+    patched_handler.init.side_effect = APIKeyError("No API key")
+
+    with pytest.raises(APIKeyError, match="No API key"):
         await handler(messages)
 
 
 @pytest.mark.asyncio
-async def test_handler_agent_not_initialized():
+async def test_handler_agent_not_initialized(patched_handler):
     """Test that handler raises error when agent is not initialized."""
     messages = [{"role": "user", "content": "Test"}]
 
-    with (
-        patch("web_extraction_agent.main._initialized", True),
-        patch("web_extraction_agent.main.run_agent", side_effect=RuntimeError("Agent not initialized")),
-        pytest.raises(RuntimeError, match="Agent not initialized"),
-    ):
+    patched_handler.run.side_effect = RuntimeError("Agent not initialized")
+
+    with pytest.raises(RuntimeError, match="Agent not initialized"):
         await handler(messages)
 
 
 @pytest.mark.asyncio
-async def test_handler_with_exa_api_key_missing():
+async def test_handler_with_exa_api_key_missing(patched_handler):
     """Test that handler raises error when Exa API key is missing."""
     messages = [{"role": "user", "content": "Test"}]
 
-    # Configure the lock to work as an async context manager
-    mock_lock_instance = MagicMock()
-    mock_lock_instance.__aenter__ = AsyncMock(return_value=None)
-    mock_lock_instance.__aexit__ = AsyncMock(return_value=None)
-
-    with (
-        patch("web_extraction_agent.main._initialized", False),
-        patch("web_extraction_agent.main.initialize_agent", side_effect=APIKeyError("Exa API key required")),
-        patch("web_extraction_agent.main._init_lock", return_value=mock_lock_instance),
-        patch("web_extraction_agent.main.run_agent", new_callable=AsyncMock),
-        pytest.raises(APIKeyError, match="Exa API key required"),
-    ):
+    patched_handler.init.side_effect = APIKeyError("Exa API key required")
+
+    with pytest.raises(APIKeyError, match="Exa API key required"):
         await handler(messages)
 
 
 @pytest.mark.asyncio
-async def test_handler_with_product_extraction_query():
+async def test_handler_with_product_extraction_query(patched_handler):
     """Test that handler can process a product extraction query."""
     messages = [
         {
@@ -204,12 +149,9 @@ async def test_handler_with_product_extraction_query():
     mock_response = MagicMock()
     mock_response.run_id = "product-extract-run-id"
     mock_response.content = "Product information extracted."
+    patched_handler.run.return_value = mock_response
 
-    with (
-        patch("web_extraction_agent.main._initialized", True),
-        patch("web_extraction_agent.main.run_agent", new_callable=AsyncMock, return_value=mock_response),
-    ):
-        result = await handler(messages)
+    result = await handler(messages)
 
     assert result is not None
     assert result.run_id == "product-extract-run-id"
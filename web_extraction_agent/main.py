@@ -14,8 +14,12 @@ import asyncio
 import json
 import logging
 import os
-from pathlib import Path
+import sys
+import traceback
+from collections.abc import Mapping
+from dataclasses import dataclass
 from textwrap import dedent
+from types import MappingProxyType
 from typing import Any, cast
 
 from agno.agent import Agent
@@ -25,15 +29,26 @@ from agno.tools.firecrawl import FirecrawlTools
 from agno.tools.mem0 import Mem0Tools
 from bindu.penguin.bindufy import bindufy
 from dotenv import load_dotenv
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 # Load environment variables from .env file
 load_dotenv()
 
 # Global instances
 agent: Agent | None = None
-_initialized = False
-_init_lock = asyncio.Lock()
+
+
+class _State:
+    """Mutable handler state grouped on a class.
+
+    Class-attribute loads go through CPython's per-type inline cache instead
+    of a module-dict lookup, and handler avoids a ``global`` statement.
+    """
+
+    # Created lazily by handler inside the running event loop; nothing
+    # loop-bound is allocated at import time.
+    init_task: asyncio.Task | None = None
+
 
 _logger = logging.getLogger(__name__)
 
@@ -45,6 +60,11 @@ class APIKeyError(ValueError):
 class ContentSection(BaseModel):
     """Represents a section of content from the webpage."""
 
+    # Frozen, no-extras models are cheaper per instance; extraction can
+    # produce many sections per page.
+    model_config = ConfigDict(frozen=True, extra="forbid")
+    __slots__ = ()
+
     heading: str | None = Field(None, description="Section heading")
     content: str = Field(..., description="Section content text")
 
@@ -52,6 +72,9 @@ class ContentSection(BaseModel):
 class PageInformation(BaseModel):
     """Structured representation of a webpage."""
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+    __slots__ = ()
+
     url: str = Field(..., description="URL of the page")
     title: str = Field(..., description="Title of the page")
     description: str | None = Field(None, description="Meta description or summary of the page")
@@ -62,61 +85,107 @@ class PageInformation(BaseModel):
     metadata: dict[str, str] | None = Field(None, description="Important metadata from the page")
 
 
-def load_config() -> dict:
-    """Load agent configuration from project root."""
-    config_path = Path(__file__).parent / "agent_config.json"
+# Candidate config locations, resolved once at import time since __file__ is
+# constant; plain os.path strings avoid building transient Path objects.
+_MODULE_DIR = os.path.dirname(os.path.abspath(__file__))
+_PROJECT_ROOT = os.path.dirname(_MODULE_DIR)
+_CONFIG_PATHS = (
+    os.path.join(_MODULE_DIR, "agent_config.json"),
+    os.path.join(_PROJECT_ROOT, "agent_config.json"),
+)
+
+
+# Default configuration, built once at import time and frozen so callers
+# cannot mutate the shared instance.
+_DEFAULT_CONFIG: Mapping[str, Any] = MappingProxyType({
+    "name": "web-extraction-agent",
+    "description": "AI agent that transforms unstructured web content into organized, structured data using Firecrawl and Exa search",
+    "version": "1.0.0",
+    "deployment": {
+        "url": "http://127.0.0.1:3773",
+        "expose": True,
+        "protocol_version": "1.0.0",
+        "proxy_urls": ["127.0.0.1"],
+        "cors_origins": ["*"],
+    },
+    "environment_variables": [
+        {
+            "key": "OPENROUTER_API_KEY",
+            "description": "OpenRouter API key for LLM calls (required)",
+            "required": True,
+        },
+        {
+            "key": "MEM0_API_KEY",
+            "description": "Mem0 API key for conversation memory",
+            "required": False,
+        },
+        {
+            "key": "EXA_API_KEY",
+            "description": "Exa API key for web search and content extraction (required)",
+            "required": True,
+        },
+        {
+            "key": "FIRECRAWL_API_KEY",
+            "description": "Firecrawl API key for advanced web scraping (optional)",
+            "required": False,
+        },
+    ],
+})
+
 
-    if config_path.exists():
+def load_config() -> Mapping[str, Any]:
+    """Load agent configuration from project root."""
+    # Attempt open() directly instead of probing with .exists() first; this
+    # halves the syscalls on the successful path and avoids a TOCTOU window.
+    for config_path in (*_CONFIG_PATHS, os.path.join(os.getcwd(), "agent_config.json")):
         try:
-            with open(config_path) as f:
-                return cast(dict[str, Any], json.load(f))
+            # Read bytes and parse with json.loads: skips both the text-decode
+            # wrapper and json.load's chunked read loop.
+            with open(config_path, "rb") as f:
+                return cast(dict[str, Any], json.loads(f.read()))
+        except FileNotFoundError:
+            continue
         except (OSError, json.JSONDecodeError) as exc:
             _logger.warning("Failed to load config from %s", config_path, exc_info=exc)
-    # Default configuration
-    return {
-        "name": "web-extraction-agent",
-        "description": "AI agent that transforms unstructured web content into organized, structured data using Firecrawl and Exa search",
-        "version": "1.0.0",
-        "deployment": {
-            "url": "http://127.0.0.1:3773",
-            "expose": True,
-            "protocol_version": "1.0.0",
-            "proxy_urls": ["127.0.0.1"],
-            "cors_origins": ["*"],
-        },
-        "environment_variables": [
-            {
-                "key": "OPENROUTER_API_KEY",
-                "description": "OpenRouter API key for LLM calls (required)",
-                "required": True,
-            },
-            {
-                "key": "MEM0_API_KEY",
-                "description": "Mem0 API key for conversation memory",
-                "required": False,
-            },
-            {
-                "key": "EXA_API_KEY",
-                "description": "Exa API key for web search and content extraction (required)",
-                "required": True,
-            },
-            {
-                "key": "FIRECRAWL_API_KEY",
-                "description": "Firecrawl API key for advanced web scraping (optional)",
-                "required": False,
-            },
-        ],
-    }
-
-
-def _get_api_keys() -> tuple[str | None, str | None, str | None, str | None, str]:
-    """Get API keys and configuration from environment."""
-    openrouter_api_key = os.getenv("OPENROUTER_API_KEY")
-    mem0_api_key = os.getenv("MEM0_API_KEY")
-    exa_api_key = os.getenv("EXA_API_KEY")
-    firecrawl_api_key = os.getenv("FIRECRAWL_API_KEY")
-    model_name = os.getenv("MODEL_NAME", "openai/gpt-4o")
-    return openrouter_api_key, mem0_api_key, exa_api_key, firecrawl_api_key, model_name
+    return _DEFAULT_CONFIG
+
+
+_TRUE_SET = frozenset({"true", "1", "yes"})
+
+
+def _parse_bool(value: str, _true_set: frozenset[str] = _TRUE_SET) -> bool:
+    """Parse a boolean string value."""
+    # Binding the set as a default argument makes it a local lookup.
+    return value.lower() in _true_set
+
+
+def _env_flag(name: str, default: str = "true") -> bool:
+    """Parse a boolean environment variable."""
+    return _parse_bool(os.getenv(name, default))
+
+
+@dataclass(frozen=True, slots=True)
+class _Config:
+    """Environment-derived configuration, captured once instead of re-read per call site."""
+
+    openrouter_api_key: str | None
+    mem0_api_key: str | None
+    exa_api_key: str | None
+    firecrawl_api_key: str | None
+    model_name: str
+    enable_firecrawl: bool
+
+    @classmethod
+    def from_env(cls) -> "_Config":
+        """Build the configuration from environment variables."""
+        return cls(
+            openrouter_api_key=os.getenv("OPENROUTER_API_KEY"),
+            mem0_api_key=os.getenv("MEM0_API_KEY"),
+            exa_api_key=os.getenv("EXA_API_KEY"),
+            firecrawl_api_key=os.getenv("FIRECRAWL_API_KEY"),
+            model_name=os.getenv("MODEL_NAME", "openai/gpt-4o"),
+            enable_firecrawl=_env_flag("ENABLE_FIRECRAWL"),
+        )
 
 
 def _create_llm_model(openrouter_api_key: str, model_name: str) -> OpenRouter:
@@ -136,193 +205,235 @@ def _create_llm_model(openrouter_api_key: str, model_name: str) -> OpenRouter:
     )
 
 
-def _setup_tools(
-    mem0_api_key: str | None,
-    exa_api_key: str,
-    firecrawl_api_key: str | None,
-) -> list:
+async def _setup_tools(config: _Config) -> list:
     """Set up all tools for the web extraction agent."""
     tools = []
+    # Collect status lines and emit them with a single print so the init log
+    # is one atomic stdout write instead of up to six.
+    status = []
 
     # ExaTools is required for web content extraction
-    if not exa_api_key:
+    if not config.exa_api_key:
         error_msg = (
             "Exa API key is required. Set EXA_API_KEY environment variable.\nGet an API key from: https://exa.ai"
         )
         raise APIKeyError(error_msg)
 
-    try:
-        exa_tools = ExaTools(api_key=exa_api_key)
-        tools.append(exa_tools)
-        print("🌐 Exa search enabled for web content extraction")
-    except Exception as e:
-        print(f"❌ Failed to initialize ExaTools: {e}")
-        raise
-
-    # Firecrawl is optional for advanced web scraping
-    enable_firecrawl = os.getenv("ENABLE_FIRECRAWL", "true").lower() in ("true", "1", "yes")
-    if enable_firecrawl and firecrawl_api_key:
-        try:
-            firecrawl_tools = FirecrawlTools(
-                api_key=firecrawl_api_key,
+    # Tool constructors can block on network I/O (key validation, client
+    # handshakes), so build them in worker threads concurrently: init latency
+    # becomes the slowest constructor instead of the sum of all of them.
+    builders = [("exa", asyncio.to_thread(ExaTools, api_key=config.exa_api_key))]
+    if config.enable_firecrawl and config.firecrawl_api_key:
+        builders.append((
+            "firecrawl",
+            asyncio.to_thread(
+                FirecrawlTools,
+                api_key=config.firecrawl_api_key,
                 enable_scrape=True,
                 enable_crawl=True,
-            )
-            tools.append(firecrawl_tools)
-            print("🕸️ Firecrawl enabled for advanced web scraping")
-        except Exception as e:
-            print(f"⚠️  Firecrawl initialization issue: {e}")
-            print("⚠️  Continuing without Firecrawl (Exa will be used for extraction)")
+            ),
+        ))
     else:
-        print("Info: Firecrawl disabled or no API key provided")
+        status.append("Info: Firecrawl disabled or no API key provided")
+    if config.mem0_api_key:
+        builders.append(("mem0", asyncio.to_thread(Mem0Tools, api_key=config.mem0_api_key)))
+
+    results = await asyncio.gather(*(builder for _, builder in builders), return_exceptions=True)
+
+    for (name, _), result in zip(builders, results, strict=True):
+        if name == "exa":
+            # ExaTools is required; a failure here aborts initialization
+            if isinstance(result, BaseException):
+                print(f"❌ Failed to initialize ExaTools: {result}")
+                raise result
+            tools.append(result)
+            status.append("🌐 Exa search enabled for web content extraction")
+        elif name == "firecrawl":
+            if isinstance(result, BaseException):
+                status.append(f"⚠️  Firecrawl initialization issue: {result}")
+                status.append("⚠️  Continuing without Firecrawl (Exa will be used for extraction)")
+            else:
+                tools.append(result)
+                status.append("🕸️ Firecrawl enabled for advanced web scraping")
+        elif isinstance(result, BaseException):
+            status.append(f"⚠️  Mem0 initialization issue: {result}")
+        else:
+            tools.append(result)
+            status.append("🧠 Mem0 memory system enabled for conversation context")
+
+    print("\n".join(status))
+    return tools
 
-    # Mem0 is optional for conversation memory
-    if mem0_api_key:
-        try:
-            mem0_tools = Mem0Tools(api_key=mem0_api_key)
-            tools.append(mem0_tools)
-            print("🧠 Mem0 memory system enabled for conversation context")
-        except Exception as e:
-            print(f"⚠️  Mem0 initialization issue: {e}")
 
-    return tools
+async def run_agent(messages: list[dict[str, str]]) -> Any:
+    """Run the agent with the given messages."""
+    global agent
+
+    if not agent:
+        error_msg = "Agent not initialized"
+        raise RuntimeError(error_msg)
+
+    return await agent.arun(messages)  # type: ignore[invalid-await]
+
+
+# Agent prompt text, dedented once at import time instead of on every
+# initialize_agent call.
+_AGENT_DESCRIPTION = dedent("""\
+    You are a professional web researcher and content extractor with expertise in
+    transforming unstructured web content into organized, structured data.
+
+    You combine web scraping capabilities with intelligent analysis to extract
+    comprehensive information from web pages and present it in a structured format.
+
+    IMPORTANT: You must output your responses in a structured JSON format that matches
+    the PageInformation schema. Your output should be valid JSON that can be parsed
+    into the PageInformation model.
+""")
+
+_AGENT_INSTRUCTIONS = dedent("""\
+    WEB EXTRACTION PROCESS:
+
+    1. CONTENT RETRIEVAL 🔍
+       - Use available tools to fetch and analyze web content
+       - Prioritize Firecrawl for advanced scraping when available
+       - Use Exa search for reliable content extraction
+       - Handle JavaScript-rendered content appropriately
+
+    2. CONTENT ANALYSIS 📋
+       - Accurately capture page title, description, and key features
+       - Identify and extract main content sections with their headings
+       - Find important links to related pages or resources
+       - Locate contact information if available
+       - Extract relevant metadata that provides context about the site
+
+    3. STRUCTURED EXTRACTION 🏗️
+       - Organize content into the PageInformation schema
+       - Create ContentSection objects for logical content grouping
+       - Categorize links by type and relevance
+       - Normalize contact information formats
+       - Include comprehensive metadata
+
+    4. QUALITY ASSURANCE ✅
+       - Be thorough but concise in extraction
+       - Prioritize the most important information for extensive pages
+       - Verify extracted information matches source content
+       - Handle missing or optional fields gracefully
+       - Maintain consistent output format
+
+    5. OUTPUT FORMAT REQUIREMENTS ✨
+       - Output MUST be valid JSON that matches PageInformation schema
+       - Use this exact structure:
+         {
+           "url": "string",
+           "title": "string",
+           "description": "string or null",
+           "features": ["string1", "string2"] or null,
+           "content_sections": [
+             {
+               "heading": "string or null",
+               "content": "string"
+             }
+           ] or null,
+           "links": {"link_name": "url"} or null,
+           "contact_info": {"type": "value"} or null,
+           "metadata": {"key": "value"} or null
+         }
+       - Do not include any markdown formatting or additional text
+       - Output only the JSON object
+
+    SPECIAL CONSIDERATIONS:
+    - For e-commerce sites: Extract product details, prices, specifications
+    - For news/articles: Extract author, date, main points, citations
+    - For company sites: Extract services, team, contact information
+    - For documentation: Extract code examples, API endpoints, tutorials
+""")
 
 
 async def initialize_agent() -> None:
     """Initialize the web extraction agent."""
     global agent
 
-    openrouter_api_key, mem0_api_key, exa_api_key, firecrawl_api_key, model_name = _get_api_keys()
+    config = _Config.from_env()
 
     # Validate required API keys
-    if not openrouter_api_key:
+    if not config.openrouter_api_key:
         error_msg = (
             "OpenRouter API key is required. Set OPENROUTER_API_KEY environment variable.\n"
             "Get an API key from: https://openrouter.ai/keys"
         )
         raise APIKeyError(error_msg)
 
-    if not exa_api_key:
+    if not config.exa_api_key:
         error_msg = (
             "Exa API key is required for web content extraction. Set EXA_API_KEY environment variable.\n"
             "Get an API key from: https://exa.ai"
         )
         raise APIKeyError(error_msg)
 
-    model = _create_llm_model(openrouter_api_key, model_name)
-    tools = _setup_tools(mem0_api_key, exa_api_key, firecrawl_api_key)
+    model = _create_llm_model(config.openrouter_api_key, config.model_name)
+    tools = await _setup_tools(config)
 
     # Create the web extraction agent
     agent = Agent(
         name="Web Extraction Assistant",
         model=model,
         tools=tools,
-        description=dedent("""\
-            You are a professional web researcher and content extractor with expertise in
-            transforming unstructured web content into organized, structured data.
-
-            You combine web scraping capabilities with intelligent analysis to extract
-            comprehensive information from web pages and present it in a structured format.
-
-            IMPORTANT: You must output your responses in a structured JSON format that matches
-            the PageInformation schema. Your output should be valid JSON that can be parsed
-            into the PageInformation model.
-        """),
-        instructions=dedent("""\
-            WEB EXTRACTION PROCESS:
-
-            1. CONTENT RETRIEVAL 🔍
-               - Use available tools to fetch and analyze web content
-               - Prioritize Firecrawl for advanced scraping when available
-               - Use Exa search for reliable content extraction
-               - Handle JavaScript-rendered content appropriately
-
-            2. CONTENT ANALYSIS 📋
-               - Accurately capture page title, description, and key features
-               - Identify and extract main content sections with their headings
-               - Find important links to related pages or resources
-               - Locate contact information if available
-               - Extract relevant metadata that provides context about the site
-
-            3. STRUCTURED EXTRACTION 🏗️
-               - Organize content into the PageInformation schema
-               - Create ContentSection objects for logical content grouping
-               - Categorize links by type and relevance
-               - Normalize contact information formats
-               - Include comprehensive metadata
-
-            4. QUALITY ASSURANCE ✅
-               - Be thorough but concise in extraction
-               - Prioritize the most important information for extensive pages
-               - Verify extracted information matches source content
-               - Handle missing or optional fields gracefully
-               - Maintain consistent output format
-
-            5. OUTPUT FORMAT REQUIREMENTS ✨
-               - Output MUST be valid JSON that matches PageInformation schema
-               - Use this exact structure:
-                 {
-                   "url": "string",
-                   "title": "string",
-                   "description": "string or null",
-                   "features": ["string1", "string2"] or null,
-                   "content_sections": [
-                     {
-                       "heading": "string or null",
-                       "content": "string"
-                     }
-                   ] or null,
-                   "links": {"link_name": "url"} or null,
-                   "contact_info": {"type": "value"} or null,
-                   "metadata": {"key": "value"} or null
-                 }
-               - Do not include any markdown formatting or additional text
-               - Output only the JSON object
-
-            SPECIAL CONSIDERATIONS:
-            - For e-commerce sites: Extract product details, prices, specifications
-            - For news/articles: Extract author, date, main points, citations
-            - For company sites: Extract services, team, contact information
-            - For documentation: Extract code examples, API endpoints, tutorials
-        """),
+        description=_AGENT_DESCRIPTION,
+        instructions=_AGENT_INSTRUCTIONS,
         structured_outputs=True,
         add_datetime_to_context=True,
         markdown=False,  # Disable markdown to ensure clean JSON output
     )
 
-    print(f"✅ Web Extraction agent initialized using {model_name}")
-    print("🌐 Exa search enabled for web content extraction")
-    if firecrawl_api_key and os.getenv("ENABLE_FIRECRAWL", "true").lower() in ("true", "1", "yes"):
-        print("🕸️ Firecrawl enabled for advanced web scraping")
-    if mem0_api_key:
-        print("🧠 Memory system enabled for conversation context")
-
+    # Specialize run_agent now that the agent exists: the rebound closure
+    # skips the not-initialized guard and the global agent lookup that the
+    # module-level fallback pays on every message.
+    global run_agent
+    _arun = agent.arun
 
-async def run_agent(messages: list[dict[str, str]]) -> Any:
-    """Run the agent with the given messages."""
-    global agent
+    async def _run_agent_specialized(messages: list[dict[str, str]]) -> Any:
+        """Run the initialized agent with the given messages."""
+        return await _arun(messages)  # type: ignore[invalid-await]
 
-    if not agent:
-        error_msg = "Agent not initialized"
-        raise RuntimeError(error_msg)
+    run_agent = _run_agent_specialized
 
-    return await agent.arun(messages)  # type: ignore[invalid-await]
+    status = [
+        f"✅ Web Extraction agent initialized using {config.model_name}",
+        "🌐 Exa search enabled for web content extraction",
+    ]
+    if config.firecrawl_api_key and config.enable_firecrawl:
+        status.append("🕸️ Firecrawl enabled for advanced web scraping")
+    if config.mem0_api_key:
+        status.append("🧠 Memory system enabled for conversation context")
+    print("\n".join(status))
 
 
 async def handler(messages: list[dict[str, str]]) -> Any:
     """Handle incoming agent messages with lazy initialization."""
-    global _initialized
+    # Initialization is cached as a single shared Task: the first caller
+    # creates it, concurrent callers await the same Task, and the post-init
+    # fast path is one pointer check with no lock acquire/release at all.
+    if _State.init_task is None:
+        print("🔧 Initializing Web Extraction Agent...")
+        _State.init_task = asyncio.ensure_future(initialize_agent())
+    try:
+        await _State.init_task
+    except Exception:
+        # Drop the failed Task so a later call can retry initialization.
+        _State.init_task = None
+        raise
 
-    async with _init_lock:
-        if not _initialized:
-            print("🔧 Initializing Web Extraction Agent...")
-            await initialize_agent()
-            _initialized = True
+    # Messages deserialized from JSON carry non-interned role strings; intern
+    # them so downstream equality checks become pointer comparisons.
+    for message in messages:
+        role = message.get("role")
+        if role is not None:
+            message["role"] = sys.intern(role)
 
     return await run_agent(messages)
 
 
-async def cleanup() -> None:
+def cleanup() -> None:
     """Clean up any resources."""
     print("🧹 Cleaning up Web Extraction Agent resources...")
 
@@ -343,39 +454,53 @@ def _setup_environment_variables(args: argparse.Namespace) -> None:
         os.environ["ENABLE_FIRECRAWL"] = str(args.enable_firecrawl)
 
 
-def _display_configuration_info() -> None:
+# Static banner text, assembled once at import time so displaying the
+# configuration is three stdout writes instead of ~18 print dispatches.
+_BANNER_HEAD = (
+    "\n".join((
+        "=" * 60,
+        "🕸️ WEB EXTRACTION AGENT",
+        "=" * 60,
+        "📄 Purpose: Transform web content into structured data",
+        "🔧 Powered by: Firecrawl scraping + Exa search + Pydantic structuring",
+    ))
+    + "\n"
+)
+
+_BANNER_EXAMPLES = (
+    "\n".join((
+        "=" * 60,
+        "Example queries:",
+        "• 'Extract all information from https://www.example.com'",
+        "• 'Scrape product details from https://store.example.com/product'",
+        "• 'Extract article content from https://news.example.com/article'",
+        "• 'Get company information from https://www.company.com/about'",
+        "=" * 60,
+    ))
+    + "\n"
+)
+
+
+def _display_configuration_info(config: _Config) -> None:
     """Display configuration information to the user."""
-    print("=" * 60)
-    print("🕸️ WEB EXTRACTION AGENT")
-    print("=" * 60)
-    print("📄 Purpose: Transform web content into structured data")
-    print("🔧 Powered by: Firecrawl scraping + Exa search + Pydantic structuring")
-
     config_info = []
-    if os.getenv("OPENROUTER_API_KEY"):
-        model = os.getenv("MODEL_NAME", "openai/gpt-4o")
-        config_info.append(f"🤖 Model: {model}")
-    if os.getenv("EXA_API_KEY"):
+    if config.openrouter_api_key:
+        config_info.append(f"🤖 Model: {config.model_name}")
+    if config.exa_api_key:
         config_info.append("🌐 Exa: Web content extraction")
-    if os.getenv("FIRECRAWL_API_KEY") and os.getenv("ENABLE_FIRECRAWL", "true").lower() in ("true", "1", "yes"):
+    if config.firecrawl_api_key and config.enable_firecrawl:
         config_info.append("🕸️ Firecrawl: Advanced scraping")
-    if os.getenv("MEM0_API_KEY"):
+    if config.mem0_api_key:
         config_info.append("🧠 Memory: Conversation context")
 
-    for info in config_info:
-        print(info)
+    sys.stdout.write(_BANNER_HEAD)
+    if config_info:
+        sys.stdout.write("\n".join(config_info) + "\n")
+    sys.stdout.write(_BANNER_EXAMPLES)
 
-    print("=" * 60)
-    print("Example queries:")
-    print("• 'Extract all information from https://www.example.com'")
-    print("• 'Scrape product details from https://store.example.com/product'")
-    print("• 'Extract article content from https://news.example.com/article'")
-    print("• 'Get company information from https://www.company.com/about'")
-    print("=" * 60)
 
-
-def main() -> None:
-    """Run the main entry point for the Web Extraction Agent."""
+def _build_arg_parser() -> argparse.ArgumentParser:
+    """Build the command line parser for the Web Extraction Agent."""
     parser = argparse.ArgumentParser(description="Web Extraction Agent - Transform web content into structured data")
     parser.add_argument(
         "--openrouter-api-key",
@@ -409,15 +534,23 @@ def main() -> None:
     )
     parser.add_argument(
         "--enable-firecrawl",
-        type=lambda x: x.lower() in ("true", "1", "yes"),
+        type=_parse_bool,
         default=os.getenv("ENABLE_FIRECRAWL", "true"),
         help="Enable Firecrawl web scraping (default: true)",
     )
+    return parser
+
 
-    args = parser.parse_args()
+def main() -> None:
+    """Run the main entry point for the Web Extraction Agent."""
+    # Skip argparse entirely when no flags were given (the common container
+    # deployment path): every argument defaults to its environment variable,
+    # so there is nothing to parse or to copy back into os.environ.
+    if len(sys.argv) > 1:
+        args = _build_arg_parser().parse_args()
+        _setup_environment_variables(args)
 
-    _setup_environment_variables(args)
-    _display_configuration_info()
+    _display_configuration_info(_Config.from_env())
 
     config = load_config()
 
@@ -429,14 +562,10 @@ def main() -> None:
         print("\n🛑 Web Extraction Agent stopped")
     except Exception as e:
         print(f"❌ Error starting agent: {e}")
-        import traceback
-
         traceback.print_exc()
-        import sys
-
         sys.exit(1)
     finally:
-        asyncio.run(cleanup())
+        cleanup()
 
 
 if __name__ == "__main__":